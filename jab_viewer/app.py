@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import sys
+
 import customtkinter as ctk
 
-try:
-    # When executed as a package module: python -m jab_viewer.app
-    from .ui_main import JABViewerApp  # type: ignore
-except Exception:
+if getattr(sys, 'frozen', False):
     # When frozen or run as a script entry by PyInstaller
     from jab_viewer.ui_main import JABViewerApp  # type: ignore
+else:
+    # When executed as a package module: python -m jab_viewer.app
+    from .ui_main import JABViewerApp  # type: ignore
 
 
 def main() -> None:
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import time
-import threading
+import sys
 from typing import Optional, Tuple
 
 import tkinter as tk
 
+# Background painted in this color is see-through (and click-through)
+_TRANSPARENT_KEY = '#010203'
+
 
 class HighlightOverlay:
-    """Creates 4 thin topmost windows to form a red rectangle border."""
+    """Creates one topmost transparent window drawing a red rectangle border."""
 
     def __init__(
         self, master: tk.Tk, color: str = '#ff2d2d', thickness: int = 3
@@ -16,39 +18,64 @@ class HighlightOverlay:
         self.master = master
         self.color = color
         self.thickness = thickness
-        self._lines = [self._create_line() for _ in range(4)]
-        self._hide_timer: Optional[threading.Timer] = None
+        # Created on the first highlight, then reused
+        self._win: Optional[tk.Toplevel] = None
+        self._canvas: Optional[tk.Canvas] = None
+        self._edges: Tuple[int, ...] = ()
+        self._hide_after_id: Optional[str] = None
 
-    def _create_line(self) -> tk.Toplevel:
+    def _create_window(self) -> Tuple[tk.Toplevel, tk.Canvas, Tuple[int, ...]]:
         win = tk.Toplevel(self.master)
         win.overrideredirect(True)
         win.attributes('-topmost', True)
-        # Solid color background
-        frame = tk.Frame(win, bg=self.color)
-        frame.pack(fill='both', expand=True)
+        try:
+            if sys.platform == 'darwin':
+                win.attributes('-transparent', True)
+            else:
+                win.attributes('-transparentcolor', _TRANSPARENT_KEY)
+        except tk.TclError:
+            pass
+        bg = (
+            'systemTransparent'
+            if sys.platform == 'darwin'
+            else _TRANSPARENT_KEY
+        )
+        canvas = tk.Canvas(win, bg=bg, highlightthickness=0, borderwidth=0)
+        canvas.pack(fill='both', expand=True)
+        # Top, bottom, left, right
+        edges = tuple(
+            canvas.create_rectangle(0, 0, 0, 0, fill=self.color, outline='')
+            for _ in range(4)
+        )
         win.withdraw()
-        return win
+        return win, canvas, edges
 
     def _place(self, x: int, y: int, w: int, h: int) -> None:
+        if self._win is None:
+            self._win, self._canvas, self._edges = self._create_window()
         t = self.thickness
-        # Top
-        self._lines[0].geometry(f'{w}x{t}+{x}+{y}')
-        # Bottom
-        self._lines[1].geometry(f'{w}x{t}+{x}+{y + h - t}')
-        # Left
-        self._lines[2].geometry(f'{t}x{h}+{x}+{y}')
-        # Right
-        self._lines[3].geometry(f'{t}x{h}+{x + w - t}+{y}')
-        for win in self._lines:
-            win.deiconify()
-            win.lift()
+        top, bottom, left, right = self._edges
+        self._win.geometry(f'{w}x{h}+{x}+{y}')
+        self._canvas.coords(top, 0, 0, w, t)
+        self._canvas.coords(bottom, 0, h - t, w, h)
+        self._canvas.coords(left, 0, 0, t, h)
+        self._canvas.coords(right, w - t, 0, w, h)
+        self._win.deiconify()
+        self._win.lift()
 
     def hide(self) -> None:
-        if self._hide_timer:
-            self._hide_timer.cancel()
-            self._hide_timer = None
-        for win in self._lines:
-            win.withdraw()
+        if self._hide_after_id:
+            try:
+                self.master.after_cancel(self._hide_after_id)
+            except Exception:
+                pass
+            self._hide_after_id = None
+        if self._win is not None:
+            self._win.withdraw()
+
+    def _do_hide(self) -> None:
+        self._hide_after_id = None
+        self.hide()
 
     def highlight(
         self, bbox: Tuple[int, int, int, int], duration_ms: int = 1200
@@ -57,8 +84,6 @@ class HighlightOverlay:
         if w <= 0 or h <= 0:
             return
         self._place(x, y, w, h)
-        if self._hide_timer:
-            self._hide_timer.cancel()
-        self._hide_timer = threading.Timer(duration_ms / 1000.0, self.hide)
-        self._hide_timer.daemon = True
-        self._hide_timer.start()
+        if self._hide_after_id:
+            self.master.after_cancel(self._hide_after_id)
+        self._hide_after_id = self.master.after(duration_ms, self._do_hide)
@@ -2,25 +2,80 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
-import configparser
+import threading
 from dataclasses import dataclass
-from typing import Dict, Optional, List
-
-try:
-    import tomllib  # Python 3.11+
-except Exception:  # pragma: no cover
-    tomllib = None  # type: ignore
+from typing import Dict, Optional, List, Tuple
 
 
 LOCALES_DIRNAME = 'locales'
 DEFAULT_LANG = 'en'
 
+# Search paths are fixed for the lifetime of the process
+_PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _build_config_search_dirs() -> Tuple[str, ...]:
+    # When frozen (PyInstaller), prefer the directory where the binary lives
+    if getattr(sys, 'frozen', False):  # type: ignore[attr-defined]
+        return (os.path.dirname(os.path.abspath(sys.executable)),)
+    # When running from source, prefer package directory
+    return (_PKG_DIR,)
+
+
+def _build_locales_dirs() -> Tuple[str, ...]:
+    dirs: List[str] = []
+    # When frozen, prefer resources extracted into _MEIPASS
+    base_meipass = getattr(sys, '_MEIPASS', None)
+    if isinstance(base_meipass, str) and base_meipass:
+        dirs.append(os.path.join(base_meipass, 'jab_viewer', LOCALES_DIRNAME))
+        dirs.append(os.path.join(base_meipass, LOCALES_DIRNAME))
+    # Always include package directory fallback
+    dirs.append(os.path.join(_PKG_DIR, LOCALES_DIRNAME))
+    return tuple(dirs)
+
+
+_CONFIG_SEARCH_DIRS = _build_config_search_dirs()
+_LOCALES_DIRS = _build_locales_dirs()
+
+_SECTION_RE = re.compile(r'^\s*\[\s*([^\]]+?)\s*\]')
+_LANGUAGE_RE = re.compile(r'^\s*language\s*=\s*["\']?([A-Za-z_\-]+)')
+
+
+def _fast_read_language(path: str) -> Optional[str]:
+    """Read ``[app] language`` from a small TOML/INI file without a parser.
+
+    Returns None when the file or the key is missing so callers can fall
+    back to the full readers.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            head = f.read(4096)
+    except Exception:
+        return None
+    section: Optional[str] = None
+    for line in head.splitlines():
+        m = _SECTION_RE.match(line)
+        if m:
+            section = m.group(1).lower()
+            continue
+        if section != 'app':
+            continue
+        m = _LANGUAGE_RE.match(line)
+        if m:
+            return m.group(1)
+    return None
+
 
 def _read_toml(path: str) -> Dict[str, object]:
     if not os.path.isfile(path):
         return {}
-    if tomllib is None:
+    try:
+        import tomllib  # Python 3.11+
+    except Exception:  # pragma: no cover
         return {}
     with open(path, 'rb') as f:
         return tomllib.load(f)  # type: ignore[no-any-return]
@@ -29,14 +84,29 @@ def _read_toml(path: str) -> Dict[str, object]:
 def _read_ini(path: str) -> Dict[str, object]:
     if not os.path.isfile(path):
         return {}
-    cp = configparser.ConfigParser()
     try:
-        cp.read(path, encoding='utf-8')
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
     except Exception:
         return {}
     data: Dict[str, object] = {}
-    for section in cp.sections():
-        data[section] = dict(cp.items(section))
+    section: Optional[Dict[str, str]] = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            section = data.setdefault(line[1:-1].strip(), {})  # type: ignore[assignment]
+            continue
+        if section is None:
+            continue
+        key, sep, value = line.partition('=')
+        if not sep:
+            key, sep, value = line.partition(':')
+            if not sep:
+                continue
+        # Option names are case-insensitive, as in configparser
+        section[key.strip().lower()] = value.strip().strip('"\'')
     return data
 
 
@@ -54,16 +124,14 @@ class I18N:
     fallback: Dict[str, str] = None  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
+        # Resolved text for keyword-less lookups, cleared on reload
+        self._cache: Dict[str, str] = {}
+        self._load_lock = threading.Lock()
+        self._loaded = False
         self.reload()
 
-    def _config_search_dirs(self) -> list[str]:
-        # When frozen (PyInstaller), prefer the directory where the binary lives
-        if getattr(sys, 'frozen', False):  # type: ignore[attr-defined]
-            exe_dir = os.path.dirname(os.path.abspath(sys.executable))
-            return [exe_dir]
-        # When running from source, prefer package directory
-        pkg_dir = os.path.dirname(os.path.abspath(__file__))
-        return [pkg_dir]
+    def _config_search_dirs(self) -> Tuple[str, ...]:
+        return _CONFIG_SEARCH_DIRS
 
     def _ensure_default_config(self, target_dir: str) -> None:
         # Create a default config next to the binary when running frozen
@@ -91,6 +159,12 @@ language = \"en\"
         for d in self._config_search_dirs():
             cfg_toml_path = os.path.join(d, 'config.toml')
             cfg_ini_path = os.path.join(d, 'config.ini')
+            fast_lang = _fast_read_language(
+                cfg_toml_path
+            ) or _fast_read_language(cfg_ini_path)
+            if fast_lang:
+                loaded_cfg = {'app': {'language': fast_lang}}
+                break
             cfg = _read_toml(cfg_toml_path) or _read_ini(cfg_ini_path)
             if cfg:
                 loaded_cfg = cfg
@@ -115,40 +189,50 @@ language = \"en\"
         return (lang or DEFAULT_LANG).lower()
 
     def reload(self) -> None:
-        self.lang = self._detect_lang()
-
-        def locales_dirs() -> List[str]:
-            dirs: List[str] = []
-            # When frozen, prefer resources extracted into _MEIPASS
-            base_meipass = getattr(sys, '_MEIPASS', None)
-            if isinstance(base_meipass, str) and base_meipass:
-                dirs.append(
-                    os.path.join(base_meipass, 'jab_viewer', LOCALES_DIRNAME)
-                )
-                dirs.append(os.path.join(base_meipass, LOCALES_DIRNAME))
-            # Always include package directory fallback
-            pkg_dir = os.path.dirname(os.path.abspath(__file__))
-            dirs.append(os.path.join(pkg_dir, LOCALES_DIRNAME))
-            return dirs
+        with self._load_lock:
+            self._cache.clear()
+            self.lang = self._detect_lang()
+            # Locale files are read on the first lookup (see _ensure_loaded)
+            self.messages = None  # type: ignore[assignment]
+            self.fallback = None  # type: ignore[assignment]
+            self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
 
         def load_lang(lang: str) -> Dict[str, str]:
-            for d in locales_dirs():
+            for d in _LOCALES_DIRS:
                 p = os.path.join(d, f'{lang}.json')
                 if os.path.isfile(p):
-                    return _load_json(p)
+                    # Interned keys match the (interned) literals used at
+                    # call sites by identity in dict lookups
+                    intern = sys.intern
+                    return {intern(k): v for k, v in _load_json(p).items()}
             return {}
 
-        self.fallback = load_lang(DEFAULT_LANG)
-        self.messages = load_lang(self.lang)
+        with self._load_lock:
+            if self._loaded:
+                return
+            self.fallback = load_lang(DEFAULT_LANG)
+            self.messages = load_lang(self.lang)
+            self._loaded = True
 
-    def tr(self, key: str, /, **kwargs) -> str:
+    def _resolve(self, key: str) -> str:
+        self._ensure_loaded()
         text = self.messages.get(key) if self.messages else None
         if not text:
             text = self.fallback.get(key, key) if self.fallback else key
-        try:
-            if kwargs:
-                return text.format(**kwargs)
+        return text
+
+    def tr(self, key: str, /, **kwargs) -> str:
+        text = self._cache.get(key)
+        if text is None:
+            text = self._cache[key] = self._resolve(key)
+        if not kwargs:
             return text
+        try:
+            return text.format_map(kwargs)
         except Exception:
             # If formatting fails, return raw text to avoid crashing UI
             return text
@@ -157,13 +241,11 @@ language = \"en\"
 _i18n = I18N()
 
 
-def tr(key: str, /, **kwargs) -> str:
-    """Translate a message key using current language.
-
-    Example:
-        tr("errors.list_windows.body", e=str(err))
-    """
-    return _i18n.tr(key, **kwargs)
+# Translate a message key using current language, e.g.
+#     tr("errors.list_windows.body", e=str(err))
+# Bound directly to the singleton so calls skip a wrapper frame; reload()
+# mutates the same instance, so existing imports of ``tr`` stay valid.
+tr = _i18n.tr
 
 
 def current_language() -> str:
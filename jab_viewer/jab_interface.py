@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ctypes
 import threading
+from collections import OrderedDict, deque
 from ctypes import wintypes
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
@@ -13,7 +14,31 @@ import win32api
 
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
 from JABWrapper.context_tree import ContextNode
-from JABWrapper.jab_types import AccessibleContextInfo, JavaObject
+from JABWrapper.jab_types import (
+    AccessibleContextInfo,
+    AccessibleHypertextInfo,
+    AccessibleTableInfo,
+    JavaObject,
+)
+
+# Roles that may expose AccessibleTable; other nodes skip the probe
+_TABLE_ROLES = frozenset({'table', 'tree table'})
+_CTX_CACHE_SIZE = 256
+# Display names for AvailableInterfaces, in collect_properties flag order
+_INTERFACE_NAMES = (
+    'Component',
+    'Action',
+    'Selection',
+    'Text',
+    'Value',
+    'Table',
+    'Hypertext',
+)
+
+
+def _collect_hwnd(hwnd: int, acc: List[int]) -> bool:
+    acc.append(hwnd)
+    return True
 
 
 @dataclass
@@ -32,36 +57,74 @@ class JabInterface:
         self._current_vm: Optional[ctypes.c_long] = None
         self._current_ctx: Optional[JavaObject] = None
         self._current_root: Optional[ContextNode] = None
+        # HWNDs already confirmed as Java windows; stale HWNDs are purged
+        self._java_hwnds: set[int] = set()
+        # Per-node hWnd/parent summaries (LRU), reset with the root
+        self._ctx_cache: OrderedDict[
+            ContextNode, Tuple[Optional[int], Optional[str]]
+        ] = OrderedDict()
+        # (root, summary); only valid while root is self._current_root
+        self._root_summary: Optional[Tuple[ContextNode, str]] = None
+        # Reusable out-buffers for interface probes
+        self._table_probe = AccessibleTableInfo()
+        self._htext_probe = AccessibleHypertextInfo()
 
     # -------------------------------
     # Windows enumeration and control
     # -------------------------------
     def list_java_windows(self) -> List[JavaWindow]:
         windows: List[JavaWindow] = []
+        hwnds: List[int] = []
+
+        # Collect handles first; filtering happens in one loop below
+        win32gui.EnumWindows(_collect_hwnd, hwnds)
+        with self._lock:
+            self._filter_java_windows(hwnds, windows)
+        # Deduplicate by hwnd and sort by title
+        unique: Dict[int, JavaWindow] = {w.hwnd: w for w in windows}
+        # HWNDs are unique here, so tuples never fall through to the window
+        items = [(w.title.lower(), w.hwnd, w) for w in unique.values()]
+        items.sort()
+        return [item[2] for item in items]
 
-        def enum_cb(hwnd, lParam):
+    def _filter_java_windows(
+        self, hwnds: List[int], windows: List[JavaWindow]
+    ) -> None:
+        # Runs under self._lock: the cache and the JAB DLL are shared with
+        # background tree loading
+        java_hwnds = self._java_hwnds
+        is_java_window = self._jab._wab.isJavaWindow  # type: ignore[attr-defined]
+        is_visible = win32gui.IsWindowVisible
+        seen = set(hwnds)
+        for hwnd in hwnds:
             # Skip invisible/minimized windows
-            if not win32gui.IsWindowVisible(hwnd):
-                return True
-            try:
-                # filter Java windows via JAB DLL
-                is_java = bool(self._jab._wab.isJavaWindow(hwnd))  # type: ignore[attr-defined]
-            except Exception:
-                is_java = False
-            if is_java:
-                length = win32gui.GetWindowTextLength(hwnd)
-                title = win32gui.GetWindowText(hwnd) if length > 0 else ''
+            if not is_visible(hwnd):
+                continue
+            # Only positive answers are cached: a JVM window can appear
+            # before the access bridge has registered it
+            if hwnd not in java_hwnds:
                 try:
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                    # filter Java windows via JAB DLL
+                    if not is_java_window(hwnd):
+                        continue
                 except Exception:
-                    pid = 0
-                windows.append(JavaWindow(hwnd=hwnd, title=title, pid=pid))
-            return True
+                    continue
+                java_hwnds.add(hwnd)
+            # Titles change; GetWindowText is a plain user32 call
+            title = win32gui.GetWindowText(hwnd)
+            try:
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            except Exception:
+                pid = 0
+            windows.append(JavaWindow(hwnd=hwnd, title=title, pid=pid))
 
-        win32gui.EnumWindows(enum_cb, None)
-        # Deduplicate by hwnd and sort by title
-        unique: Dict[int, JavaWindow] = {w.hwnd: w for w in windows}
-        return sorted(unique.values(), key=lambda w: (w.title.lower(), w.hwnd))
+        # Drop cache entries for windows that no longer exist
+        java_hwnds &= seen
+
+    def forget_window(self, hwnd: int) -> None:
+        """Drop cached enumeration results for a single HWND."""
+        with self._lock:
+            self._java_hwnds.discard(hwnd)
 
     def focus_window(self, hwnd: int) -> None:
         try:
@@ -91,19 +154,61 @@ class JabInterface:
     # JAB context / tree
     # -------------------------------
     def set_root_from_hwnd(self, hwnd: int) -> ContextNode:
-        vm_id, ctx = self._jab.get_accessible_context_from_hwnd(
-            wintypes.HWND(hwnd)
-        )
+        h = wintypes.HWND(hwnd)
+        try:
+            vm_id, ctx = self._jab.get_accessible_context_from_hwnd(h)
+        except Exception:
+            # Re-probe this window on the next enumeration
+            self.forget_window(hwnd)
+            raise
         self._current_vm = vm_id
         self._current_ctx = ctx
+        self._ctx_cache.clear()
         self._jab.set_context(vm_id, ctx)
-        self._jab.set_hwnd(wintypes.HWND(hwnd))
-        # Build full tree (can be heavy on very large apps)
+        self._jab.set_hwnd(h)
+        # Only the root is parsed here; children are parsed by expand_node
         self._current_root = ContextNode(
-            self._jab, ctx, self._lock, ancestry=0, parse_children=True
+            self._jab, ctx, self._lock, ancestry=0, parse_children=False
         )
         return self._current_root
 
+    def expand_node(self, node: ContextNode) -> List[ContextNode]:
+        """Parse the direct children of ``node`` once and return them."""
+        with self._lock:
+            if getattr(node, '_expanded', False):
+                return node.children
+            # Attached only once every child parsed, so a failure midway
+            # leaves the node unexpanded instead of half-filled
+            children: List[ContextNode] = []
+            for i in range(node.context_info.childrenCount):
+                child_ctx = self._jab.get_child_context(node.context, i)
+                children.append(
+                    ContextNode(
+                        self._jab,
+                        child_ctx,
+                        self._lock,
+                        ancestry=node.ancestry + 1,
+                        parse_children=False,
+                        parent=node,
+                    )
+                )
+            node.children.extend(children)
+            node._expanded = True
+            return node.children
+
+    def expand_all(self, root: ContextNode) -> List[ContextNode]:
+        """Parse the whole subtree under ``root`` level by level.
+
+        Returns every node of the subtree in breadth-first order.
+        """
+        nodes: List[ContextNode] = []
+        pending = deque([root])
+        while pending:
+            node = pending.popleft()
+            nodes.append(node)
+            pending.extend(self.expand_node(node))
+        return nodes
+
     def get_root(self) -> Optional[ContextNode]:
         return self._current_root
 
@@ -117,123 +222,156 @@ class JabInterface:
     # Helpers to extract properties
     # -------------------------------
     def collect_properties(self, node: ContextNode) -> Dict[str, object]:
-        aci = node.context_info
-        props: Dict[str, object] = {}
-
-        # Basic
-        props['Name'] = aci.name
-        props['Description'] = aci.description
-        props['LocalizedRole'] = aci.role
-        props['Role'] = aci.role_en_US
-        props['LocalizedStates'] = aci.states
-        props['States'] = aci.states_en_US
-        props['IndexInParent'] = aci.indexInParent
-        props['Length'] = (
-            getattr(node.text, 'char_count', None)
-            if hasattr(node, 'text')
-            else None
-        )
-        props['Depth'] = node.ancestry
-        props['X'] = aci.x
-        props['Y'] = aci.y
-        props['W'] = aci.width
-        props['H'] = aci.height
-        props['Location'] = (aci.x, aci.y, aci.width, aci.height)
-
-        # Interface flags
-        props['AccessibleComponent'] = bool(aci.accessibleComponent)
-        props['AccessibleAction'] = bool(aci.accessibleAction)
-        props['AccessibleSelection'] = bool(aci.accessibleSelection)
-        props['AccessibleText'] = bool(aci.accessibleText)
-        props['AccessibleValue'] = bool(aci.accessibleValue)
-
-        # Mirrored "Is*InterfaceAvailable" keys
-        props['IsComponentInterfaceAvailable'] = props['AccessibleComponent']
-        props['IsActionInterfaceAvailable'] = props['AccessibleAction']
-        props['IsSelectionInterfaceAvailable'] = props['AccessibleSelection']
-        props['IsTextInterfaceAvailable'] = props['AccessibleText']
-        props['IsValueInterfaceAvailable'] = props['AccessibleValue']
-
-        # Table / Hypertext availability via probing
-        is_table = False
-        is_htext = False
-        try:
-            _ = self._jab.get_accessible_table_info(node.context)
-            is_table = True
-        except Exception:
-            pass
-        try:
-            _ = self._jab.get_accessible_hypertext(node.context)
-            is_htext = True
-        except Exception:
-            pass
-        props['IsTableInterfaceAvailable'] = is_table
-        props['IsHypertextInterfaceAvailable'] = is_htext
-
-        available = []
-        for key in [
-            'IsComponentInterfaceAvailable',
-            'IsActionInterfaceAvailable',
-            'IsSelectionInterfaceAvailable',
-            'IsTextInterfaceAvailable',
-            'IsValueInterfaceAvailable',
-            'IsTableInterfaceAvailable',
-            'IsHypertextInterfaceAvailable',
-        ]:
-            if props.get(key):
-                available.append(
-                    key.replace('Is', '').replace('InterfaceAvailable', '')
-                )
-        props['AvailableInterfaces'] = ', '.join(available)
+        # The loading worker parses with the same lock, released between
+        # nodes, so a selection waits for one node at most
+        with self._lock:
+            aci = node.context_info
+            # Fields read more than once below; each read goes through ctypes
+            role_en = aci.role_en_US
+            states_en = aci.states_en_US
+            x, y, w, h = aci.x, aci.y, aci.width, aci.height
+            component = bool(aci.accessibleComponent)
+            action = bool(aci.accessibleAction)
+            selection = bool(aci.accessibleSelection)
+            text = bool(aci.accessibleText)
+            value = bool(aci.accessibleValue)
+
+            # Table / Hypertext availability via probing (only where plausible)
+            table_role = (role_en or '').lower() in _TABLE_ROLES
+            is_table = table_role and self._probe_jab(
+                'getAccessibleTableInfo', node.context, self._table_probe
+            )
+            is_htext = text and self._probe_jab(
+                'getAccessibleHypertext', node.context, self._htext_probe
+            )
+
+            flags = (
+                component,
+                action,
+                selection,
+                text,
+                value,
+                is_table,
+                is_htext,
+            )
+
+            props: Dict[str, object] = {
+                # Basic
+                'Name': aci.name,
+                'Description': aci.description,
+                'LocalizedRole': aci.role,
+                'Role': role_en,
+                'LocalizedStates': aci.states,
+                'States': states_en,
+                'IndexInParent': aci.indexInParent,
+                'Length': (
+                    getattr(node.text, 'char_count', None)
+                    if hasattr(node, 'text')
+                    else None
+                ),
+                'Depth': node.ancestry,
+                'X': x,
+                'Y': y,
+                'W': w,
+                'H': h,
+                'Location': (x, y, w, h),
+                # Interface flags and their "Is*InterfaceAvailable" mirrors
+                'AccessibleComponent': component,
+                'AccessibleAction': action,
+                'AccessibleSelection': selection,
+                'AccessibleText': text,
+                'AccessibleValue': value,
+                'IsComponentInterfaceAvailable': component,
+                'IsActionInterfaceAvailable': action,
+                'IsSelectionInterfaceAvailable': selection,
+                'IsTextInterfaceAvailable': text,
+                'IsValueInterfaceAvailable': value,
+                'IsTableInterfaceAvailable': is_table,
+                'IsHypertextInterfaceAvailable': is_htext,
+                'AvailableInterfaces': ', '.join(
+                    name for name, flag in zip(_INTERFACE_NAMES, flags) if flag
+                ),
+            }
 
-        # Visibility
-        props['IsVisible'] = 'showing' in (
-            aci.states_en_US or ''
-        ) or 'visible' in (aci.states_en_US or '')
+            # Visibility
+            states = states_en or ''
+            props['IsVisible'] = 'showing' in states or 'visible' in states
 
-        # Key bindings
+            # Key bindings
+            try:
+                kb = node.keybinds.list_key_bindings()
+                props['KeyBindings'] = '; '.join(kb) if kb else None
+            except Exception:
+                props['KeyBindings'] = None
+
+            # Window handle and parent summary
+            props['hWnd'], props['Parent'] = self._context_summary(node)
+            props['RootElement'] = self._root_element_summary()
+
+            # Children counts
+            props['Children'] = aci.childrenCount
+            props['VisibleDescendants'] = node.visible_children_count
+            props['VisibleDescendantsCount'] = node.visible_children_count
+
+        return props
+
+    def _probe_jab(
+        self, func_name: str, context: JavaObject, out: ctypes.Structure
+    ) -> bool:
+        # Call the BOOL-returning DLL function directly; the wrapper methods
+        # raise on FALSE, which is the common case for these probes
         try:
-            kb = node.keybinds.list_key_bindings()
-            props['KeyBindings'] = '; '.join(kb) if kb else None
+            fn = getattr(self._jab._wab, func_name)  # type: ignore[attr-defined]
+            return bool(fn(self._jab._vmID, context, ctypes.byref(out)))
         except Exception:
-            props['KeyBindings'] = None
+            return False
 
-        # Window handle
+    def _context_summary(
+        self, node: ContextNode
+    ) -> Tuple[Optional[int], Optional[str]]:
+        cache = self._ctx_cache
+        cached = cache.get(node)
+        if cached is not None:
+            cache.move_to_end(node)
+            return cached
         try:
-            props['hWnd'] = self.get_hwnd_for_context(node.context)
+            hwnd: Optional[int] = self.get_hwnd_for_context(node.context)
         except Exception:
-            props['hWnd'] = None
-
-        # Parent/Root summaries
+            hwnd = None
         try:
             parent_ctx = self._jab.get_accessible_parent_from_context(
                 node.context
             )
             parent_info = self._jab.get_context_info(parent_ctx)
-            props['Parent'] = (
+            parent: Optional[str] = (
                 f'{parent_info.role} | {parent_info.name}'
                 if parent_ctx
                 else None
             )
         except Exception:
-            props['Parent'] = None
+            parent = None
+        cache[node] = (hwnd, parent)
+        if len(cache) > _CTX_CACHE_SIZE:
+            cache.popitem(last=False)
+        return hwnd, parent
 
+    def _root_element_summary(self) -> Optional[str]:
+        # Checked against the current root rather than reset on load, so a
+        # lookup racing a tree load cannot cache the previous root
+        root = self._current_root
+        cached = self._root_summary
+        if cached is not None and cached[0] is root:
+            return cached[1]
+        if not root:
+            return None
         try:
-            root = self._current_root
-            if root:
-                props[
-                    'RootElement'
-                ] = f'{root.context_info.role} | {root.context_info.name}'
+            summary = f'{root.context_info.role} | {root.context_info.name}'
         except Exception:
-            props['RootElement'] = None
-
-        # Children counts
-        props['Children'] = aci.childrenCount
-        props['VisibleDescendants'] = node.visible_children_count
-        props['VisibleDescendantsCount'] = node.visible_children_count
-
-        return props
+            return None
+        self._root_summary = (root, summary)
+        return summary
 
     def get_bounds(self, node: ContextNode) -> Tuple[int, int, int, int]:
-        aci = node.context_info
-        return aci.x, aci.y, aci.width, aci.height
+        with self._lock:
+            aci = node.context_info
+            return aci.x, aci.y, aci.width, aci.height
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import bisect
 import fnmatch
+import functools
+import itertools
 import os
 import re
 import threading
 import tkinter as tk
-from collections import deque
+from dataclasses import dataclass, field
 from tkinter import filedialog
 from tkinter import font as tkfont
 from tkinter import messagebox, ttk
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -22,6 +25,161 @@ from .i18n import tr
 from .jab_interface import JabInterface, JavaWindow
 from .utils import ENV_DLL_KEY, ensure_wab_env
 
+# Keys recognized in a locator string, e.g. "text=OK, type=JButton"
+_LOCATOR_KEY_RE = re.compile(
+    r'(name|text|type|class|role|label|title|index)\s*[:=]', re.I
+)
+
+# Characters that make a locator name a glob pattern
+_GLOB_META = frozenset('*?[]')
+
+# Cached locator searches kept per loaded tree
+_LOCATOR_RESULTS_MAX = 128
+
+# Display order of the properties panel
+_PROPS_ORDER: Tuple[str, ...] = (
+    'Name',
+    'Description',
+    'LocalizedRole',
+    'Role',
+    'LocalizedStates',
+    'States',
+    'IndexInParent',
+    'Length',
+    'Depth',
+    'X',
+    'Y',
+    'W',
+    'H',
+    'Location',
+    'AccessibleComponent',
+    'AccessibleAction',
+    'AccessibleSelection',
+    'AccessibleText',
+    'IsValueInterfaceAvailable',
+    'IsActionInterfaceAvailable',
+    'IsComponentInterfaceAvailable',
+    'IsSelectionInterfaceAvailable',
+    'IsTableInterfaceAvailable',
+    'IsTextInterfaceAvailable',
+    'IsHypertextInterfaceAvailable',
+    'AvailableInterfaces',
+    'IsVisible',
+    'KeyBindings',
+    'hWnd',
+    'Parent',
+    'RootElement',
+    'Children',
+    'VisibleDescendants',
+    'VisibleDescendantsCount',
+)
+
+# Map common AccessibleRole names (lowercase) to Swing class names
+_ROLE_TO_SWING_TYPE: Dict[str, str] = {
+    'frame': 'JFrame',
+    'root pane': 'JRootPane',
+    'panel': 'JPanel',
+    'label': 'JLabel',
+    'push button': 'JButton',
+    'toggle button': 'JToggleButton',
+    'check box': 'JCheckBox',
+    'radio button': 'JRadioButton',
+    'text': 'JTextField',
+    'password text': 'JPasswordField',
+    'text area': 'JTextArea',
+    'combo box': 'JComboBox',
+    'list': 'JList',
+    'table': 'JTable',
+    'tree': 'JTree',
+    'tab page': 'JTabbedPane',
+    'scroll pane': 'JScrollPane',
+    'tool bar': 'JToolBar',
+    'menu bar': 'JMenuBar',
+    'menu': 'JMenu',
+    'menu item': 'JMenuItem',
+    'popup menu': 'JPopupMenu',
+    'separator': 'JSeparator',
+    'slider': 'JSlider',
+    'spinner': 'JSpinner',
+    'desktop pane': 'JDesktopPane',
+    'internal frame': 'JInternalFrame',
+    'split pane': 'JSplitPane',
+    'progress bar': 'JProgressBar',
+    'editor pane': 'JEditorPane',
+    'formatted text': 'JFormattedTextField',
+    'color chooser': 'JColorChooser',
+    'file chooser': 'JFileChooser',
+    'option pane': 'JOptionPane',
+    'layered pane': 'JLayeredPane',
+    'glass pane': 'GlassPane',
+    'viewport': 'JViewport',
+}
+
+
+def _store_locator_value(data: Dict[str, object], key: str, raw: str) -> bool:
+    raw = raw.strip().strip(',;')
+    # Strip optional quotes
+    if (raw.startswith('"') and raw.endswith('"')) or (
+        raw.startswith("'") and raw.endswith("'")
+    ):
+        raw = raw[1:-1]
+    if key == 'index':
+        try:
+            data[key] = int(raw)
+        except Exception:
+            return False
+    else:
+        data[key] = raw
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_locator_text(s: str) -> Optional[Tuple[Tuple[str, object], ...]]:
+    if not s:
+        return None
+    # Accept formats like: key=value, key: value; separated by comma/semicolon
+    data: Dict[str, object] = {}
+    # Each value runs from the end of its key to the start of the next key
+    prev_key: Optional[str] = None
+    prev_end = 0
+    for m in _LOCATOR_KEY_RE.finditer(s):
+        if prev_key is not None and not _store_locator_value(
+            data, prev_key, s[prev_end : m.start()]
+        ):
+            return None
+        prev_key = m.group(1).lower()
+        prev_end = m.end()
+    if prev_key is None:
+        return None
+    if not _store_locator_value(data, prev_key, s[prev_end:]):
+        return None
+    # Tuple so the cached value cannot be mutated by callers
+    return tuple(data.items())
+
+
+@dataclass
+class _LocatorIndex:
+    """Locator keys of every node, parallel to the flat node list.
+
+    ``by_*`` map a key to node positions in tree (BFS) order.
+    """
+
+    role_texts: List[str] = field(default_factory=list)  # stripped
+    names: List[str] = field(default_factory=list)  # stripped
+    roles: List[str] = field(default_factory=list)  # stripped, lowercased
+    # stripped, lowercased
+    names_lower: List[str] = field(default_factory=list)
+    types: List[Optional[str]] = field(default_factory=list)
+    # names_lower sorted, with the matching positions, for prefix lookups
+    sorted_names: List[str] = field(default_factory=list)
+    sorted_positions: List[int] = field(default_factory=list)
+    by_role: Dict[str, List[int]] = field(default_factory=dict)
+    by_name: Dict[str, List[int]] = field(default_factory=dict)
+    by_name_type: Dict[Tuple[str, str], List[int]] = field(
+        default_factory=dict
+    )
+    by_type: Dict[str, List[int]] = field(default_factory=dict)
+
 
 class JABViewerApp(ctk.CTk):
     def __init__(self) -> None:
@@ -54,14 +212,22 @@ class JABViewerApp(ctk.CTk):
         self._windows: Dict[str, JavaWindow] = {}
         self._tree_nodes: Dict[str, object] = {}
         self._selected_hwnd: Optional[int] = None
-        self._node_to_iid: Dict[int, str] = {}
-        self._all_nodes: list[tuple[str, object]] = []
+        self._all_nodes: list[object] = []
+        self._locator_index = _LocatorIndex()
+        # Search results per locator text for the current tree
+        self._locator_results: Dict[str, Tuple[object, Optional[str]]] = {}
+        # Inserted items whose children are still a placeholder row
+        self._lazy_iids: set[str] = set()
+        # Set once the worker has indexed every node for locators
+        self._index_ready: bool = False
+        # Pending after() id of a debounced tree selection
+        self._select_pending: Optional[str] = None
 
         # Async loading state
         self._is_loading: bool = False
+        self._windows_seq: int = 0
         self._load_seq: int = 0
         self._loading_thread: Optional[threading.Thread] = None
-        self._pending_insert: deque[Tuple[Optional[str], object]] = deque()
 
         self._build_ui()
         self._overlay = HighlightOverlay(self)
@@ -135,6 +301,7 @@ class JABViewerApp(ctk.CTk):
         self.tree.pack(side='left', fill='both', expand=True)
         vsb.pack(side='right', fill='y')
         self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_tree_open)
         # Expand column to occupy width
         self.tree.column('#0', stretch=True, minwidth=150, anchor='w')
 
@@ -255,19 +422,31 @@ class JABViewerApp(ctk.CTk):
             self.props_table.tag_configure('prop-sep', background='#ececec')
         except Exception:
             pass
+        # Tooltip for property names, created hidden and reused
+        self._props_tooltip_win = tk.Toplevel(self)
+        self._props_tooltip_win.wm_overrideredirect(True)
+        self._props_tooltip_win.attributes('-topmost', True)
+        self._props_tooltip_win.withdraw()
+        self._props_tooltip_label = tk.Label(
+            self._props_tooltip_win,
+            borderwidth=1,
+            relief='solid',
+            padx=6,
+            pady=3,
+        )
+        self._props_tooltip_label.pack()
         # Apply theme aware colors for the props table
         self._apply_props_theme()
-        # Tooltip for property names
-        self._props_tooltip_win = None
         self._props_tooltip_after = None
         self._props_tooltip_text = None
         self._props_tooltip_row = None
         self.props_table.bind('<Motion>', self._on_props_table_motion)
         self.props_table.bind('<Leave>', lambda e: self._hide_props_tooltip())
         self.props_table.bind('<Button>', lambda e: self._hide_props_tooltip())
-        # Rewrap values on resize of the container
+        # Rewrap values on resize of the container (debounced)
+        self._props_refresh_after: Optional[str] = None
         props_container.bind(
-            '<Configure>', lambda e: self._refresh_props_table_wrapped()
+            '<Configure>', lambda e: self._schedule_props_refresh()
         )
 
         # Add panes with weights and min sizes (favor tree area)
@@ -292,6 +471,11 @@ class JABViewerApp(ctk.CTk):
         # Data for props wrapping and copy
         self._props_rows_data: List[Tuple[str, str]] = []
         self._props_iid_to_raw: Dict[str, str] = {}
+        # Memoized font.measure for wrapping, rebuilt when the font changes
+        self._props_measure: Optional[Callable[[str], int]] = None
+        self._props_measure_font: Optional[str] = None
+        # Value column width of the last rebuild; -1 forces the next one
+        self._last_wrap_col_w: int = -1
 
     # ----------------------
     # Internal helpers
@@ -334,14 +518,36 @@ class JABViewerApp(ctk.CTk):
     # Actions
     # ----------------------
     def reload_windows(self) -> None:
-        try:
-            wins = self.jab.list_java_windows()
-        except Exception as e:
-            messagebox.showerror(
-                tr('errors.list_windows.title'),
-                tr('errors.list_windows.body', e=str(e)),
-            )
-            return
+        # Enumerate off the Tk thread; isJavaWindow may block on the JVM
+        self._windows_seq += 1
+        seq = self._windows_seq
+
+        def worker():
+            try:
+                wins = self.jab.list_java_windows()
+            except Exception as e:
+                # 'e' is unbound once the except block ends; pass the text
+                def on_err(msg: str):
+                    if seq != self._windows_seq:
+                        return
+                    messagebox.showerror(
+                        tr('errors.list_windows.title'),
+                        tr('errors.list_windows.body', e=msg),
+                    )
+
+                self.after(0, on_err, str(e))
+                return
+
+            def on_ready():
+                if seq != self._windows_seq:
+                    return
+                self._apply_windows(wins)
+
+            self.after(0, on_ready)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_windows(self, wins: List[JavaWindow]) -> None:
         prev_hwnd = self._selected_hwnd
         self._windows.clear()
         items = []
@@ -397,101 +603,171 @@ class JABViewerApp(ctk.CTk):
         seq = self._load_seq
         self._set_loading(True, 'ui.loading.tree')
 
+        def on_err(msg: str):
+            if seq != self._load_seq:
+                return
+            self._set_loading(False)
+            messagebox.showerror(
+                tr('errors.load_tree.title'),
+                tr('errors.load_tree.body', e=msg),
+            )
+
         def worker():
             try:
                 root = self.jab.set_root_from_hwnd(hwnd)
+                # Only the first level is parsed before the tree is painted
+                first = [root, *self.jab.expand_node(root)]
+                # Reading role/name goes through JAB; do it off the UI thread
+                for n in first:
+                    n._label = self._node_label(n)
             except Exception as e:
-
-                def on_err():
-                    if seq != self._load_seq:
-                        return
-                    self._set_loading(False)
-                    messagebox.showerror(
-                        tr('errors.load_tree.title'),
-                        tr('errors.load_tree.body', e=str(e)),
-                    )
-
-                self.after(0, on_err)
+                self.after(0, on_err, str(e))
                 return
 
-            def on_ready():
+            def on_root_ready():
                 # Only proceed if still the latest request
                 if seq != self._load_seq:
                     return
                 self._populate_tree_async(root)
 
-            self.after(0, on_ready)
+            self.after(0, on_root_ready)
+
+            try:
+                # Locator matching needs every node; parse the rest while
+                # the first level is already on screen
+                nodes = self.jab.expand_all(root)
+                for n in nodes:
+                    if getattr(n, '_label', None) is None:
+                        n._label = self._node_label(n)
+                index = self._build_locator_index(nodes)
+            except Exception as e:
+                self.after(0, on_err, str(e))
+                return
+
+            def on_index_ready():
+                if seq != self._load_seq:
+                    return
+                self._apply_locator_index(nodes, index)
+
+            self.after(0, on_index_ready)
 
         t = threading.Thread(target=worker, daemon=True)
         self._loading_thread = t
         t.start()
 
     def _populate_tree_async(self, root_node) -> None:
-        # Reset tree and state
-        self.tree.delete(*self.tree.get_children())
-        self._tree_nodes.clear()
-        self._node_to_iid.clear()
-        self._all_nodes.clear()
-        self._pending_insert.clear()
-
-        def label_for(node) -> str:
-            aci = node.context_info
-            role = (aci.role or aci.role_en_US or '').strip()
-            name = (aci.name or '').strip()
-            return f'{role} | {name}' if name else role
+        try:
+            # Reset tree and state
+            self.tree.delete(*self.tree.get_children())
+            self._tree_nodes.clear()
+            # Locator data arrives with _apply_locator_index
+            self._index_ready = False
+            self._all_nodes = []
+            self._locator_index = _LocatorIndex()
+            self._lazy_iids.clear()
+            self._locator_results.clear()
+            # Only the root and its children become Treeview items; deeper
+            # levels are inserted when their parent is opened
+            root_iid = self._insert_tree_node('', root_node, open=True)
+            self._expand_iid(root_iid)
+            # Select root
+            self.tree.selection_set(root_iid)
+            self.tree.focus(root_iid)
+        except Exception:
+            pass
+        # Controls stay disabled until the worker has indexed every node
+        self.loading_text_var.set(tr('ui.loading.index'))
+
+    def _apply_locator_index(
+        self, nodes: list[object], index: _LocatorIndex
+    ) -> None:
+        # Flat list of every node for locator matching, built by the worker
+        self._all_nodes = nodes
+        self._locator_index = index
+        self._locator_results.clear()
+        self._index_ready = True
+        self._set_loading(False)
+        sel = self.tree.selection()
+        node = self._tree_nodes.get(sel[0]) if sel else None
+        if node is not None:
+            self._update_current_locator(node)
 
-        # Seed with root; parent_iid None means insert under ''
-        self._pending_insert.append((None, root_node))
+    def _node_label(self, node) -> str:
+        aci = node.context_info
+        role = (aci.role or aci.role_en_US or '').strip()
+        name = (aci.name or '').strip()
+        return f'{role} | {name}' if name else role
+
+    def _insert_tree_node(
+        self, parent_iid: str, node, open: bool = False
+    ) -> str:
+        # Set by the loading worker, like _iid and _locator_pos
+        text = getattr(node, '_label', None)
+        if text is None:
+            text = self._node_label(node)
+        # Raw Tcl calls skip Treeview.insert's option formatting; this runs
+        # once per inserted item
+        tree = self.tree
+        iid = tree.tk.call(
+            tree._w,
+            'insert',
+            parent_iid,
+            'end',
+            '-text',
+            text,
+            '-open',
+            int(open),
+        )
+        self._tree_nodes[iid] = node
+        # Nodes are rebuilt on every load, so the iid never goes stale
+        node._iid = iid
+        if node.context_info.childrenCount > 0:
+            # Placeholder so the item shows an expand indicator
+            tree.tk.call(tree._w, 'insert', iid, 'end', '-text', '…')
+            self._lazy_iids.add(iid)
+        return iid
+
+    def _expand_iid(self, iid: str) -> None:
+        if iid not in self._lazy_iids:
+            return
+        children = self.jab.expand_node(self._tree_nodes[iid])
+        self._lazy_iids.discard(iid)
+        self.tree.delete(*self.tree.get_children(iid))
+        for child in children:
+            self._insert_tree_node(iid, child)
+
+    def _on_tree_open(self, event=None) -> None:
+        # The item being opened is the focused one
+        try:
+            self._expand_iid(self.tree.focus())
+        except Exception:
+            pass
 
-        BATCH = 300
+    def _ensure_iid(self, node) -> Optional[str]:
+        # Insert the ancestors of a node that is not yet in the Treeview
+        path = []
+        cur = node
+        while cur is not None and getattr(cur, '_iid', None) is None:
+            path.append(cur)
+            cur = cur.parent
+        if cur is None:
+            return None
+        for n in reversed(path):
+            self._expand_iid(n.parent._iid)
+        return getattr(node, '_iid', None)
 
-        def process_batch():
-            # If another load started, stop
-            if not self._pending_insert:
-                # Done
-                self._set_loading(False)
-                return
-            count = 0
+    def _on_tree_select(self, event=None) -> None:
+        # Coalesce rapid selection changes (e.g. holding an arrow key) so
+        # only the final row queries JAB
+        if self._select_pending is not None:
             try:
-                while self._pending_insert and count < BATCH:
-                    parent_iid, node = self._pending_insert.popleft()
-                    text = label_for(node)
-                    if parent_iid is None:
-                        iid = self.tree.insert('', 'end', text=text)
-                        # Open root by default
-                        self.tree.item(iid, open=True)
-                    else:
-                        iid = self.tree.insert(parent_iid, 'end', text=text)
-                        # Keep everything expanded for easier navigation
-                        self.tree.item(iid, open=True)
-                    self._tree_nodes[iid] = node
-                    self._node_to_iid[id(node)] = iid
-                    self._all_nodes.append((iid, node))
-                    # Enqueue children
-                    for child in getattr(node, 'children', []):
-                        self._pending_insert.append((iid, child))
-                    count += 1
-                if not self._pending_insert:
-                    # Select root if present
-                    try:
-                        root_iid = self._node_to_iid.get(id(root_node))
-                        if root_iid:
-                            self.tree.selection_set(root_iid)
-                            self.tree.focus(root_iid)
-                    except Exception:
-                        pass
-                    self._set_loading(False)
-                else:
-                    # Schedule next chunk
-                    self.after(1, process_batch)
+                self.after_cancel(self._select_pending)
             except Exception:
-                # Ensure loading indicator is cleared on errors
-                self._set_loading(False)
-
-        # Kick the async insertion
-        self.after(0, process_batch)
+                pass
+        self._select_pending = self.after(50, self._do_select)
 
-    def _on_tree_select(self, event=None) -> None:
+    def _do_select(self) -> None:
+        self._select_pending = None
         sel = self.tree.selection()
         if not sel:
             return
@@ -507,49 +783,13 @@ class JABViewerApp(ctk.CTk):
 
     def _render_props(self, props: Dict[str, object]) -> None:
         # Capture data and (re)render table with wrapped values in cells
-        self._props_rows_data.clear()
         self._props_iid_to_raw.clear()
-        order = [
-            'Name',
-            'Description',
-            'LocalizedRole',
-            'Role',
-            'LocalizedStates',
-            'States',
-            'IndexInParent',
-            'Length',
-            'Depth',
-            'X',
-            'Y',
-            'W',
-            'H',
-            'Location',
-            'AccessibleComponent',
-            'AccessibleAction',
-            'AccessibleSelection',
-            'AccessibleText',
-            'IsValueInterfaceAvailable',
-            'IsActionInterfaceAvailable',
-            'IsComponentInterfaceAvailable',
-            'IsSelectionInterfaceAvailable',
-            'IsTableInterfaceAvailable',
-            'IsTextInterfaceAvailable',
-            'IsHypertextInterfaceAvailable',
-            'AvailableInterfaces',
-            'IsVisible',
-            'KeyBindings',
-            'hWnd',
-            'Parent',
-            'RootElement',
-            'Children',
-            'VisibleDescendants',
-            'VisibleDescendantsCount',
+        self._last_wrap_col_w = -1
+        self._props_rows_data = [
+            (k, '' if props[k] is None else str(props[k]))
+            for k in _PROPS_ORDER
+            if k in props
         ]
-        for k in order:
-            if k in props:
-                val = props[k]
-                sval = '' if val is None else str(val)
-                self._props_rows_data.append((k, sval))
         self._refresh_props_table_wrapped()
 
     def _on_props_right_click(self, event) -> None:
@@ -585,6 +825,19 @@ class JABViewerApp(ctk.CTk):
             )
         except Exception:
             pass
+        try:
+            # Same appearance mode lookup as the table colors above
+            tip_bg, tip_fg, tip_bd = self._tooltip_colors(mode)
+            self._props_tooltip_label.configure(
+                background=tip_bg, foreground=tip_fg
+            )
+            self._props_tooltip_win.configure(
+                background=tip_bg, highlightbackground=tip_bd
+            )
+        except Exception:
+            pass
+        # Style changes may alter the font; force new measurements
+        self._props_measure = None
 
     def _on_props_table_motion(self, event) -> None:
         try:
@@ -619,44 +872,16 @@ class JABViewerApp(ctk.CTk):
         except Exception:
             self._hide_props_tooltip()
 
-    def _tooltip_colors(self) -> Tuple[str, str, str]:
-        try:
-            mode = str(ctk.get_appearance_mode())
-        except Exception:
-            mode = 'Light'
+    @staticmethod
+    def _tooltip_colors(mode: str) -> Tuple[str, str, str]:
         if 'Dark' in mode:
             return ('#333333', '#ffffff', '#444444')  # bg, fg, border
         return ('#ffffe0', '#111111', '#d8d8a8')
 
     def _show_props_tooltip(self, text: str, x: int, y: int) -> None:
         try:
-            bg, fg, bd = self._tooltip_colors()
-            if self._props_tooltip_win is None:
-                tw = tk.Toplevel(self)
-                tw.wm_overrideredirect(True)
-                tw.attributes('-topmost', True)
-                lbl = tk.Label(
-                    tw,
-                    text=text,
-                    background=bg,
-                    foreground=fg,
-                    borderwidth=1,
-                    relief='solid',
-                    padx=6,
-                    pady=3,
-                )
-                lbl.pack()
-                self._props_tooltip_win = tw
-            else:
-                # update text and colors
-                for w in self._props_tooltip_win.winfo_children():
-                    try:
-                        w.configure(text=text, background=bg, foreground=fg)
-                    except Exception:
-                        pass
-            self._props_tooltip_win.configure(
-                background=bg, highlightbackground=bd
-            )
+            # Colors are set by _apply_props_theme
+            self._props_tooltip_label.configure(text=text)
             self._props_tooltip_win.wm_geometry(f'+{x}+{y}')
             self._props_tooltip_win.deiconify()
         except Exception:
@@ -670,11 +895,10 @@ class JABViewerApp(ctk.CTk):
                 except Exception:
                     pass
                 self._props_tooltip_after = None
-            if self._props_tooltip_win is not None:
-                try:
-                    self._props_tooltip_win.withdraw()
-                except Exception:
-                    pass
+            try:
+                self._props_tooltip_win.withdraw()
+            except Exception:
+                pass
             self._props_tooltip_text = None
             self._props_tooltip_row = None
         except Exception:
@@ -698,8 +922,16 @@ class JABViewerApp(ctk.CTk):
                     raw = str(vals[1])
                 else:
                     return
+            # Let Tk finish handling the click before touching the
+            # clipboard and title
+            self.after_idle(self._finish_props_copy, str(raw))
+        except Exception:
+            pass
+
+    def _finish_props_copy(self, raw: str) -> None:
+        try:
             self.clipboard_clear()
-            self.clipboard_append(str(raw))
+            self.clipboard_append(raw)
             self.title(tr('window.title.copied_value'))
             self.after(900, lambda: self.title('JABViewer'))
         except Exception:
@@ -708,46 +940,77 @@ class JABViewerApp(ctk.CTk):
     # ----------------------
     # Props table wrapping helpers
     # ----------------------
-    def _wrap_text_to_width(self, text: str, width_px: int, font_obj) -> str:
+    def _wrap_text_to_width(
+        self, text: str, width_px: int, measure: Callable[[str], int]
+    ) -> str:
         text = text or ''
         if width_px <= 40:
             return text
-        words = re.split(r'(\s+)', text)
+        space_w = measure(' ')
         lines: List[str] = []
-        cur = ''
-        for w in words:
-            if not w:
-                continue
-            candidate = cur + w
-            if font_obj.measure(candidate) <= width_px:
-                cur = candidate
-                continue
-            # If single token is too long, split by characters via binary search
-            if cur:
-                lines.append(cur)
-                cur = ''
-            while w and font_obj.measure(w) > width_px:
-                lo, hi = 1, len(w)
-                fit = 1
-                while lo <= hi:
-                    mid = (lo + hi) // 2
-                    if font_obj.measure(w[:mid]) <= width_px:
-                        fit = mid
-                        lo = mid + 1
-                    else:
-                        hi = mid - 1
-                lines.append(w[:fit])
-                w = w[fit:]
-            cur = w
-        if cur:
-            lines.append(cur)
+        # Hard line breaks in the value are kept; each paragraph is filled
+        # greedily by summing word widths instead of re-measuring the line
+        for para in text.split('\n'):
+            cur: List[str] = []
+            cur_w = 0
+            for w in para.split():
+                ww = measure(w)
+                add = ww + space_w if cur else ww
+                if cur_w + add <= width_px:
+                    cur.append(w)
+                    cur_w += add
+                    continue
+                if cur:
+                    lines.append(' '.join(cur))
+                    cur = []
+                    cur_w = 0
+                if ww <= width_px:
+                    cur.append(w)
+                    cur_w = ww
+                    continue
+                # Token too long: cut it where the running per-character
+                # width crosses the column, then carry on after the tail
+                cum = list(itertools.accumulate(map(measure, w)))
+                pos = 0
+                base = 0
+                while True:
+                    end = max(
+                        bisect.bisect_right(cum, base + width_px, pos), pos + 1
+                    )
+                    if end >= len(w):
+                        cur.append(w[pos:])
+                        cur_w = cum[-1] - base
+                        break
+                    lines.append(w[pos:end])
+                    base = cum[end - 1]
+                    pos = end
+            lines.append(' '.join(cur))
         return '\n'.join(lines)
 
+    def _schedule_props_refresh(self) -> None:
+        # Coalesce bursts of <Configure> (e.g. drag-resize) into one rewrap
+        if self._props_refresh_after is not None:
+            try:
+                self.after_cancel(self._props_refresh_after)
+            except Exception:
+                pass
+        self._props_refresh_after = self.after(100, self._on_props_refresh_due)
+
+    def _on_props_refresh_due(self) -> None:
+        self._props_refresh_after = None
+        self._refresh_props_table_wrapped()
+
     def _refresh_props_table_wrapped(self) -> None:
         try:
             if not hasattr(self, 'props_table') or not self._props_rows_data:
                 return
             col_w = int(self.props_table.column('value', 'width') or 320)
+            # Same rows, same width and font: the table is already right
+            if (
+                col_w == self._last_wrap_col_w
+                and self._props_measure is not None
+            ):
+                return
             style_font = self._props_tv_style.lookup('Props.Treeview', 'font')
             try:
                 font_obj = (
@@ -757,17 +1020,31 @@ class JABViewerApp(ctk.CTk):
                 )
             except Exception:
                 font_obj = tkfont.nametofont('TkDefaultFont')
+            font_name = str(font_obj)
+            if (
+                self._props_measure is None
+                or self._props_measure_font != font_name
+            ):
+                self._props_measure = functools.lru_cache(maxsize=8192)(
+                    font_obj.measure
+                )
+                self._props_measure_font = font_name
+            measure = self._props_measure
 
             # Rebuild rows with wrapped value
-            prev_sel = self.props_table.selection()
             self.props_table.delete(*self.props_table.get_children())
             self._props_iid_to_raw.clear()
 
-            row_idx = 0
+            max_w = max(40, col_w - 12)
             for k, raw in self._props_rows_data:
-                wrapped = self._wrap_text_to_width(
-                    raw, max(40, col_w - 12), font_obj
-                )
+                # Single-line values that already fit need no wrapping
+                if '\n' not in raw and measure(raw) <= max_w:
+                    iid = self.props_table.insert(
+                        '', 'end', values=(k, raw), tags=('prop-sep',)
+                    )
+                    self._props_iid_to_raw[iid] = raw
+                    continue
+                wrapped = self._wrap_text_to_width(raw, max_w, measure)
                 parts = wrapped.split('\n') if wrapped else ['']
                 for idx, seg in enumerate(parts):
                     key_cell = k if idx == 0 else ''
@@ -783,101 +1060,59 @@ class JABViewerApp(ctk.CTk):
                 )
             except Exception:
                 pass
-            if prev_sel:
-                try:
-                    self.props_table.selection_set(prev_sel)
-                except Exception:
-                    pass
+            self._last_wrap_col_w = col_w
         except Exception:
             pass
 
     # ----------------------
     # Locator helpers
     # ----------------------
-    def _role_to_swing_type(self, role_en: str) -> Optional[str]:
-        # Map common AccessibleRole names to Swing class names
-        role = (role_en or '').strip().lower()
-        mapping = {
-            'frame': 'JFrame',
-            'root pane': 'JRootPane',
-            'panel': 'JPanel',
-            'label': 'JLabel',
-            'push button': 'JButton',
-            'toggle button': 'JToggleButton',
-            'check box': 'JCheckBox',
-            'radio button': 'JRadioButton',
-            'text': 'JTextField',
-            'password text': 'JPasswordField',
-            'text area': 'JTextArea',
-            'combo box': 'JComboBox',
-            'list': 'JList',
-            'table': 'JTable',
-            'tree': 'JTree',
-            'tab page': 'JTabbedPane',
-            'scroll pane': 'JScrollPane',
-            'tool bar': 'JToolBar',
-            'menu bar': 'JMenuBar',
-            'menu': 'JMenu',
-            'menu item': 'JMenuItem',
-            'popup menu': 'JPopupMenu',
-            'separator': 'JSeparator',
-            'slider': 'JSlider',
-            'spinner': 'JSpinner',
-            'desktop pane': 'JDesktopPane',
-            'internal frame': 'JInternalFrame',
-            'split pane': 'JSplitPane',
-            'progress bar': 'JProgressBar',
-            'editor pane': 'JEditorPane',
-            'formatted text': 'JFormattedTextField',
-            'color chooser': 'JColorChooser',
-            'file chooser': 'JFileChooser',
-            'option pane': 'JOptionPane',
-            'layered pane': 'JLayeredPane',
-            'glass pane': 'GlassPane',
-            'viewport': 'JViewport',
-        }
-        return mapping.get(role)
+    @staticmethod
+    def _role_to_swing_type(role_en: str) -> Optional[str]:
+        return (
+            _ROLE_TO_SWING_TYPE.get(role_en.strip().lower())
+            if role_en
+            else None
+        )
 
     def _update_current_locator(self, node) -> None:
-        aci = node.context_info
-        role = (aci.role_en_US or aci.role or '').strip()
-        name = (aci.name or '').strip()
+        if not self._index_ready:
+            # Duplicate counting needs the full index; shown once it lands
+            self._set_current_locator('')
+            return
+        index = self._locator_index
+        pos = getattr(node, '_locator_pos', None)
+        if pos is not None:
+            role = index.role_texts[pos]
+            name = index.names[pos]
+            swing_type = index.types[pos]
+        else:
+            aci = node.context_info
+            role = (aci.role_en_US or aci.role or '').strip()
+            name = (aci.name or '').strip()
+            swing_type = self._role_to_swing_type(role)
 
         # Build preferred locator compatible with RemoteSwingLibrary
         # Prefer text/name, then type; add index if duplicates
-        swing_type = self._role_to_swing_type(role)
-
-        def norm(s: str) -> str:
-            return s.strip()
-
-        def candidate_keys(n) -> Tuple[str, Optional[str]]:
-            a = n.context_info
-            r = (a.role_en_US or a.role or '').strip()
-            nm = (a.name or '').strip()
-            return nm, self._role_to_swing_type(r)
-
-        # Collect duplicates matching same name + type
-        matches: List[object] = []
+        # Duplicates matching same name + type
         if name:
-            for _iid, n in self._all_nodes:
-                nm, t = candidate_keys(n)
-                if norm(nm) == norm(name) and (
-                    not swing_type or t == swing_type
-                ):
-                    matches.append(n)
-        else:
-            # No name; group by type only
             if swing_type:
-                for _iid, n in self._all_nodes:
-                    _nm, t = candidate_keys(n)
-                    if t == swing_type:
-                        matches.append(n)
+                positions = index.by_name_type.get((name, swing_type), [])
+            else:
+                positions = index.by_name.get(name, [])
+        elif swing_type:
+            # No name; group by type only
+            positions = index.by_type.get(swing_type, [])
+        else:
+            positions = []
 
+        # Positions are in tree order, so the node's rank is a bisect away;
+        # a unique match never gets an index= part
         idx = 1
-        for i, n in enumerate(matches, start=1):
-            if n is node:
-                idx = i
-                break
+        if pos is not None and len(positions) > 1:
+            k = bisect.bisect_left(positions, pos)
+            if k < len(positions) and positions[k] == pos:
+                idx = k + 1
 
         parts: List[str] = []
         if name:
@@ -889,9 +1124,11 @@ class JABViewerApp(ctk.CTk):
             # Fallback on role
             if role:
                 parts.append(f'role={role}')
-        if len(matches) > 1:
+        if len(positions) > 1:
             parts.append(f'index={idx}')
-        locator = ', '.join(parts)
+        self._set_current_locator(', '.join(parts))
+
+    def _set_current_locator(self, locator: str) -> None:
         try:
             self.current_locator_entry.configure(state='normal')
             self.current_locator_var.set(locator)
@@ -899,35 +1136,51 @@ class JABViewerApp(ctk.CTk):
         except Exception:
             pass
 
-    def _parse_locator(self, s: str):
-        if not s:
-            return None
-        # Accept formats like: key=value, key: value; separated by comma/semicolon
-        pattern = re.compile(
-            r'(name|text|type|class|role|label|title|index)\s*[:=]', re.I
+    def _build_locator_index(self, nodes: List[object]) -> _LocatorIndex:
+        index = _LocatorIndex()
+        for i, n in enumerate(nodes):
+            aci = n.context_info
+            r = (aci.role_en_US or aci.role or '').strip()
+            nm = (aci.name or '').strip()
+            # Lowercase once; r is already stripped for the type lookup
+            r_lower = r.lower()
+            t = _ROLE_TO_SWING_TYPE.get(r_lower) if r_lower else None
+            # Lets selection read these lists instead of context_info
+            n._locator_pos = i
+            index.role_texts.append(r)
+            index.names.append(nm)
+            index.roles.append(r_lower)
+            index.names_lower.append(nm.lower())
+            index.types.append(t)
+            index.by_role.setdefault(r_lower, []).append(i)
+            if nm:
+                index.by_name.setdefault(nm, []).append(i)
+            if t:
+                index.by_type.setdefault(t, []).append(i)
+                if nm:
+                    index.by_name_type.setdefault((nm, t), []).append(i)
+        names_lower = index.names_lower
+        index.sorted_positions = sorted(
+            range(len(names_lower)), key=names_lower.__getitem__
         )
-        it = list(pattern.finditer(s))
-        if not it:
-            return None
-        data: Dict[str, object] = {}
-        for i, m in enumerate(it):
-            key = m.group(1).lower()
-            start = m.end()
-            end = it[i + 1].start() if i + 1 < len(it) else len(s)
-            raw = s[start:end].strip().strip(',;')
-            # Strip optional quotes
-            if (raw.startswith('"') and raw.endswith('"')) or (
-                raw.startswith("'") and raw.endswith("'")
-            ):
-                raw = raw[1:-1]
-            if key == 'index':
-                try:
-                    data[key] = int(raw)
-                except Exception:
-                    return None
-            else:
-                data[key] = raw
-        return data
+        index.sorted_names = [names_lower[i] for i in index.sorted_positions]
+        return index
+
+    @staticmethod
+    def _name_prefix_range(
+        index: _LocatorIndex, prefix: str
+    ) -> Tuple[int, int]:
+        # Names starting with prefix form one run of the sorted list; the
+        # highest code point bounds it (a name would need U+10FFFF right
+        # after the prefix to be missed)
+        names = index.sorted_names
+        lo = bisect.bisect_left(names, prefix)
+        hi = bisect.bisect_left(names, prefix + '\U0010ffff', lo)
+        return lo, hi
+
+    def _parse_locator(self, s: str) -> Optional[Dict[str, object]]:
+        items = _parse_locator_text(s)
+        return dict(items) if items is not None else None
 
     def _find_by_locator(self, loc):
         if not isinstance(loc, dict):
@@ -943,43 +1196,52 @@ class JABViewerApp(ctk.CTk):
         if not any([role, name, typev]):
             return None, 'invalid'
 
-        def match_text(value: str, pat: str) -> bool:
-            v = (value or '').strip()
-            p = (pat or '').strip()
-            if not p:
-                return True
-            if any(ch in p for ch in '*?[]'):
-                return fnmatch.fnmatch(v.lower(), p.lower())
-            # Default to startswith (case-insensitive)
-            return v.lower().startswith(p.lower())
-
-        def match_equals_ci(value: str, pat: str) -> bool:
-            return (value or '').strip().lower() == (pat or '').strip().lower()
-
-        def type_matches(role_en: str, type_pat: str) -> bool:
-            # Accept both simple names and FQCN, match by simple name
-            if not type_pat:
-                return True
-            simple = type_pat.split('.')[-1].strip()
-            t = self._role_to_swing_type(role_en) or ''
-            return t == simple
-
-        matches: List[Tuple[str, object]] = []
-        for iid, node in self._all_nodes:
-            aci = node.context_info
-            r = (aci.role_en_US or aci.role or '').strip()
-            nm = (aci.name or '').strip()
+        role_pat = str(role).strip().lower() if role else ''
+        name_pat = str(name).strip().lower() if name else ''
+        has_glob = not _GLOB_META.isdisjoint(name_pat)
+        # Compile the glob once instead of going through fnmatch per node
+        glob_match = (
+            re.compile(fnmatch.translate(name_pat)).match if has_glob else None
+        )
+        # Accept both simple names and FQCN, match by simple name
+        simple_type = str(typev).split('.')[-1].strip() if typev else ''
+
+        # Narrow to the exact-match keys through the index; the filters
+        # below still run on every candidate
+        lookup = self._locator_index
+        roles = lookup.roles
+        names_lower = lookup.names_lower
+        types = lookup.types
+        if role:
+            candidates = lookup.by_role.get(role_pat, [])
+        elif simple_type:
+            candidates = lookup.by_type.get(simple_type, [])
+        else:
+            candidates = range(len(self._all_nodes))
+        if name_pat and not has_glob and candidates:
+            # A literal name is a prefix match; use its sorted run when
+            # that is the smaller candidate set
+            lo, hi = self._name_prefix_range(lookup, name_pat)
+            if hi - lo < len(candidates):
+                # Back to tree order so index= numbering is unchanged
+                candidates = sorted(lookup.sorted_positions[lo:hi])
 
-            ok = True
-            if role:
-                ok = ok and match_equals_ci(r, str(role))
-            if name:
-                ok = ok and match_text(nm, str(name))
-            if typev:
-                ok = ok and type_matches(r, str(typev))
+        matches: List[object] = []
+        for i in candidates:
+            if role and roles[i] != role_pat:
+                continue
+            if name_pat:
+                nm = names_lower[i]
+                if glob_match is not None:
+                    if not glob_match(nm):
+                        continue
+                # Default to startswith (case-insensitive)
+                elif not nm.startswith(name_pat):
+                    continue
+            if typev and (types[i] or '') != simple_type:
+                continue
             # label/title not supported yet
-            if ok:
-                matches.append((iid, node))
+            matches.append(self._all_nodes[i])
 
         if not matches:
             return [], None
@@ -1023,14 +1285,22 @@ class JABViewerApp(ctk.CTk):
             pass
 
     def _on_locator_search(self) -> None:
+        # Controls are disabled while indexing; also guard the Enter binding
+        if not self._index_ready:
+            return
         try:
             self.locator_msg.configure(text='')
             text = self.locator_input_var.get().strip()
-            loc = self._parse_locator(text)
-            if not loc:
-                self.locator_msg.configure(text=tr('ui.locator.invalid'))
-                return
-            results, err = self._find_by_locator(loc)
+            found = self._locator_results.get(text)
+            if found is None:
+                loc = self._parse_locator(text)
+                found = (
+                    self._find_by_locator(loc) if loc else (None, 'invalid')
+                )
+                if len(self._locator_results) >= _LOCATOR_RESULTS_MAX:
+                    self._locator_results.clear()
+                self._locator_results[text] = found
+            results, err = found
             if err == 'invalid':
                 self.locator_msg.configure(text=tr('ui.locator.invalid'))
                 return
@@ -1042,7 +1312,10 @@ class JABViewerApp(ctk.CTk):
                     text=tr('ui.locator.many_found', n=len(results))
                 )
                 return
-            iid, _node = results[0]
+            iid = self._ensure_iid(results[0])
+            if not iid:
+                self.locator_msg.configure(text=tr('ui.locator.not_found'))
+                return
             self._select_iid(iid)
         except Exception:
             self.locator_msg.configure(text=tr('ui.locator.invalid'))
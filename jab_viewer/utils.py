@@ -3,12 +3,24 @@ from typing import Optional
 
 ENV_DLL_KEY = 'RC_JAVA_ACCESS_BRIDGE_DLL'
 
+# Common default locations of the WindowsAccessBridge DLL
+_WAB_CANDIDATES = (
+    r'C:\Program Files\Java\jre\bin\WindowsAccessBridge-64.dll',
+    r'C:\Program Files\Java\jdk\bin\WindowsAccessBridge-64.dll',
+    r'C:\Program Files\Java\jdk-17\bin\WindowsAccessBridge-64.dll',
+    r'C:\Program Files\Java\jdk-21\bin\WindowsAccessBridge-64.dll',
+)
+
+# Path found by the last ensure_wab_env() probe of the default locations
+_CACHED_DLL_PATH: Optional[str] = None
+
 
 def ensure_wab_env(dll_path: Optional[str] = None) -> Optional[str]:
     """Ensure the WindowsAccessBridge DLL path is available in env.
 
     Returns the DLL path in use, or None if not set.
     """
+    global _CACHED_DLL_PATH
     if dll_path:
         os.environ[ENV_DLL_KEY] = dll_path
         return dll_path
@@ -17,16 +29,13 @@ def ensure_wab_env(dll_path: Optional[str] = None) -> Optional[str]:
     if current and os.path.isfile(os.path.normpath(current)):
         return current
 
+    if _CACHED_DLL_PATH and os.path.isfile(_CACHED_DLL_PATH):
+        os.environ[ENV_DLL_KEY] = _CACHED_DLL_PATH
+        return _CACHED_DLL_PATH
+
     # Try common default locations
-    candidates = [
-        r'C:\\Program Files\\Java\\jre\\bin\\WindowsAccessBridge-64.dll',
-        r'C:\\Program Files\\Java\\jdk\\bin\\WindowsAccessBridge-64.dll',
-        r'C:\\Program Files\\Java\\jdk-17\\bin\\WindowsAccessBridge-64.dll',
-        r'C:\\Program Files\\Java\\jdk-21\\bin\\WindowsAccessBridge-64.dll',
-    ]
-    for c in candidates:
-        if os.path.isfile(c):
-            os.environ[ENV_DLL_KEY] = c
-            return c
-
-    return None
+    found = next((c for c in _WAB_CANDIDATES if os.path.isfile(c)), None)
+    if found:
+        os.environ[ENV_DLL_KEY] = found
+        _CACHED_DLL_PATH = found
+    return found